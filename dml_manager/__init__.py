@@ -1 +1,2 @@
 from ._dml_manager import DMLManager, CriteriaStructure
+from ._typing import DBCredentials
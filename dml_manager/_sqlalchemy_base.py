@@ -4,4 +4,4 @@ from sqlalchemy.orm import DeclarativeBase
 class _BaseType(DeclarativeBase):
     pass
 
-DeclarativeBaseClass = TypeVar("T", bound= _BaseType)
+DeclarativeBaseClass = TypeVar("DeclarativeBaseClass", bound= _BaseType)
@@ -1,11 +1,19 @@
-from typing import Literal, Union, TypedDict, Callable
-from sqlalchemy.orm import Mapper
-from sqlalchemy.sql.elements import BinaryExpression
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Literal, Union, TypedDict, NamedTuple, Callable, get_args
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.dml import Delete, Update
+from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
 
 # Operadores de comparación para queries SQL
 ComparisonOperator = Literal['=', '!=', '>', '>=', '<', '<=', '><', 'in', 'not in', 'ilike', 'not ilike', '~', '~*']
 # Operadores lógicos para queries SQL
 LogicOperator = Literal['&', '|']
+# Conjuntos de operadores válidos para validación en tiempo constante
+_VALID_OPS = frozenset(get_args(ComparisonOperator))
+_VALID_LOGIC = frozenset(get_args(LogicOperator))
+# Operadores de comparación con una colección de valores
+_ARRAY_OPS = frozenset(('in', 'not in'))
 # Tipo de dato de valor para queries SQL
 TripletValue = Union[
     int,
@@ -66,22 +74,89 @@ Los operadores lógicos disponibles son:
 - `'|'`: OR
 """
 
-# Función de operador
-OperatorCallback = Callable[[Mapper, str, TripletValue], BinaryExpression]
+# Forma de tripleta para sentencias parametrizadas (campo, operador, valor nulo)
+TripletShape = tuple[str, ComparisonOperator, bool]
+# Forma de criterio de búsqueda para sentencias parametrizadas
+CriteriaShape = tuple[
+    Union[
+        LogicOperator,
+        TripletShape
+    ],
+    ...
+]
 
-# Formato de salida
-OutputFormat = Literal["dataframe", "dict"]
+# Función de operador de comparación a partir del atributo de la columna y el valor
+OperatorCallback = Callable[[InstrumentedAttribute, TripletValue], BinaryExpression]
 
 # Formato de credenciales para uso de base de datos
-class DBCredentials(TypedDict):
+@dataclass(slots= True, frozen= True)
+class DBCredentials():
+    host: str
+    port: int
+    db_name: str
+    user: str
+    password: str
+
+# Formato de credenciales en diccionario, como se reciben desde JSON o variables de entorno
+class DBCredentialsDict(TypedDict):
     host: str
     port: int
     db_name: str
     user: str
     password: str
 
+# Metadatos precalculados de una tabla
+class TableMeta(NamedTuple):
+    # Clase de la tabla
+    instance: type
+    # Atributo del campo de ID
+    id_column: InstrumentedAttribute
+    # Atributos de la tabla por nombre de campo
+    columns_by_name: dict[str, InstrumentedAttribute]
+    # Nombres de todos los campos de la tabla en orden de lectura
+    all_columns: tuple[str, ...]
+    # Atributos de los campos a leer por defecto, iniciando por el ID
+    default_fields: tuple[InstrumentedAttribute, ...]
+    # Expresiones de ordenamiento por (nombre de campo, ascendente)
+    sort_expressions: dict[tuple[str, bool], UnaryExpression]
+    # Tipos de dato de NumPy de los campos numéricos
+    numpy_dtypes: dict[str, str]
+    # Sentencias de modificación por una ID y por lista de IDs
+    update_by_id: Update
+    update_by_ids: Update
+    # Sentencias de eliminación por una ID y por lista de IDs
+    delete_by_id: Delete
+    delete_by_ids: Delete
+
+# Controladores de conexión a PostgreSQL
+DriverOptions = Literal['psycopg', 'psycopg2']
+
 # Opciones de salida de datos
-OutputOptions = Literal['dataframe', 'dict']
+OutputOptions = Literal['dataframe', 'dict', 'arrow', 'arrow_dataframe', 'json']
+
+# Formato de salida interno, usado como índice de los constructores de salida
+class OutputFormat(IntEnum):
+    DATAFRAME = 0
+    DICT = 1
+    ARROW = 2
+    ARROW_DATAFRAME = 3
+    JSON = 4
+
+    @classmethod
+    def parse(cls, value: 'OutputOptions | OutputFormat') -> 'OutputFormat':
+        """
+        ## Conversión de opción de salida
+        Obtiene el formato de salida a partir de su nombre (`'dataframe'`, `'dict'`,
+        `'arrow'`, `'arrow_dataframe'` o `'json'`).
+        """
+
+        if isinstance(value, cls):
+            return value
+
+        try:
+            return cls[value.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Formato de salida no válido: {value!r}") from None
 
 # Lista de diccionario serializable a JSON
 SerializableDict = list[dict[str, Union[int, float, str, bool, list[int]]]]
@@ -1,5 +1,9 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+# README read once, with the file closed after reading
+_LONG_DESC = Path(__file__).with_name('README.md').read_text(encoding='utf-8')
+
 setup(
     # Library name and version
     name="dml_manager",
@@ -8,9 +12,14 @@ setup(
     # Dependencies
     install_requires=[
         "pandas==2.2.3",
-        "psycopg2==2.9.10",
+        "psycopg[binary]>=3.1",
         "SQLAlchemy==2.0.37",
     ],
+    extras_require={
+        "psycopg2": ["psycopg2==2.9.10"],
+        "arrow": ["pyarrow"],
+        "json": ["orjson"],
+    },
 
     # My name here
     author="Pável Hernández",
@@ -21,7 +30,7 @@ setup(
     description="Librería dedicada a la gestión de transacciones en bases de datos, orientada a PostgreSQL",
 
     # Documentation
-    long_description=open('README.md').read(),
+    long_description=_LONG_DESC,
     long_description_content_type='text/markdown',
     url="https://github.com/onnymm/dml_manager",
 
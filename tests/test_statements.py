@@ -0,0 +1,47 @@
+import unittest
+from sqlalchemy import Numeric, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from dml_manager import DMLManager
+
+
+class _Base(DeclarativeBase):
+    pass
+
+class Codes(_Base):
+    __tablename__ = 'codes'
+    id: Mapped[str] = mapped_column(String(3), primary_key= True)
+
+class Amounts(_Base):
+    __tablename__ = 'amounts'
+    id: Mapped[float] = mapped_column(Numeric(10, 2), primary_key= True)
+
+
+class TestPrebuiltStatements(unittest.TestCase):
+    """
+    Compilación de las sentencias precalculadas de modificación y eliminación por
+    lista de IDs, sin conexión a la base de datos.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.db = DMLManager('postgresql+psycopg://user@localhost/db', _Base)
+
+    def _compile(self, table_name: str, statement: str) -> str:
+        stmt = getattr(self.db._tables_meta[table_name], statement)
+        return str(stmt.compile(dialect= self.db._engine.dialect))
+
+    def test_ids_array_without_length(self) -> None:
+        for statement in ('update_by_ids', 'delete_by_ids'):
+            sql = self._compile('codes', statement)
+            self.assertIn('::VARCHAR[]', sql)
+            self.assertNotIn('VARCHAR(3)', sql)
+
+    def test_ids_array_without_precision(self) -> None:
+        for statement in ('update_by_ids', 'delete_by_ids'):
+            sql = self._compile('amounts', statement)
+            self.assertIn('::NUMERIC[]', sql)
+            self.assertNotIn('NUMERIC(10, 2)', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()